@@ -21,7 +21,11 @@ setup(
     package_dir={"": "src"},
     include_package_data=True,
     install_requires=requirements,
-    extras_require={"test": ["pytest", "responses", "httpx>=0.27"]},
+    extras_require={
+        "test": ["pytest", "responses", "httpx>=0.27", "ijson>=3.2"],
+        # Streams county parcel GeoJSON instead of loading whole files.
+        "parcels": ["ijson>=3.2"],
+    },
     entry_points={
         "console_scripts": [
             "florida_property_scraper=florida_property_scraper.__main__:main",
@@ -1,6 +1,20 @@
-"""Package initializer for `florida_property_scraper`."""
+"""Package initializer for `florida_property_scraper`.
 
-from .run_result import RunResult
-from .scraper import FloridaPropertyScraper
+Top-level names are resolved lazily (PEP 562) so importing a submodule such
+as ``florida_property_scraper.leads`` does not pull in Scrapy/Twisted through
+``scraper``.
+"""
 
 __all__ = ["FloridaPropertyScraper", "RunResult"]
+
+
+def __getattr__(name: str):
+    if name == "FloridaPropertyScraper":
+        from .scraper import FloridaPropertyScraper
+
+        return FloridaPropertyScraper
+    if name == "RunResult":
+        from .run_result import RunResult
+
+        return RunResult
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
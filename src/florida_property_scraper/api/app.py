@@ -40,6 +40,27 @@ ROOT = Path(__file__).resolve().parents[2]
 WEB_DIR = ROOT / "web"
 _router = get_router("fl")
 
+# Hover whitelist and its empty defaults, shared by the bbox and search routes.
+_EMPTY_HOVER = {
+    "situs_address": "",
+    "owner_name": "",
+    "last_sale_date": None,
+    "last_sale_price": 0,
+    # PA-only: unknown unless explicitly present in PA.
+    "mortgage_amount": None,
+}
+_SALE_FIELDS = frozenset(
+    {
+        # PA hover fields
+        "last_sale_date",
+        "last_sale_price",
+        # Scraper-derived fields (future)
+        "sale_date",
+        "sale_price",
+        "deed_type",
+    }
+)
+
 
 def health():
     return {"status": "ok"}
@@ -208,28 +229,12 @@ if app:
         finally:
             store.close()
 
-        allowed_hover_keys = {
-            "situs_address",
-            "owner_name",
-            "last_sale_date",
-            "last_sale_price",
-            "mortgage_amount",
-        }
-
         features_out = []
         for f in feats:
             hover = hover_by_parcel.get(f.parcel_id) or {}
-            props = {
-                "parcel_id": f.parcel_id,
-                # Hover whitelist only
-                "situs_address": "",
-                "owner_name": "",
-                "last_sale_date": None,
-                "last_sale_price": 0,
-                # PA-only: unknown unless explicitly present in PA.
-                "mortgage_amount": None,
-            }
-            for k in allowed_hover_keys:
+            # Hover whitelist only
+            props = {"parcel_id": f.parcel_id, **_EMPTY_HOVER}
+            for k in _EMPTY_HOVER:
                 if k in hover:
                     props[k] = hover[k]
 
@@ -338,39 +343,22 @@ if app:
         try:
             parcel_ids = [f.parcel_id for f in intersecting]
             pa_by_id = store.get_many(county=county_key, parcel_ids=parcel_ids)
-            hover_by_id = store.get_hover_fields_many(
-                county=county_key, parcel_ids=parcel_ids
-            )
         finally:
             store.close()
+        # Hover fields derive from the same PA rows; no second query needed.
+        hover_by_id = {pid: PASQLite.hover_fields(rec) for pid, rec in pa_by_id.items()}
 
         filters = compile_filters(payload.get("filters"))
 
         raw_triggers = payload.get("triggers") if flags.triggers else None
         triggers = compile_triggers(raw_triggers)
 
-        sale_fields = {
-            # PA hover fields
-            "last_sale_date",
-            "last_sale_price",
-            # Scraper-derived fields (future)
-            "sale_date",
-            "sale_price",
-            "deed_type",
-        }
-
         results = []
         for feat in intersecting:
             pa = pa_by_id.get(feat.parcel_id)
             pa_dict = pa.to_dict() if pa is not None else None
             computed = compute_ui_fields(pa_dict)
-            hover = hover_by_id.get(feat.parcel_id) or {
-                "situs_address": "",
-                "owner_name": "",
-                "last_sale_date": None,
-                "last_sale_price": 0,
-                "mortgage_amount": None,
-            }
+            hover = hover_by_id.get(feat.parcel_id) or dict(_EMPTY_HOVER)
 
             fields: dict[str, object] = {}
             if pa_dict:
@@ -380,7 +368,7 @@ if app:
 
             # Optional safety valve: prevent sale-based filtering/triggering.
             if not flags.sale_filtering:
-                for k in sale_fields:
+                for k in _SALE_FIELDS:
                     fields.pop(k, None)
 
             if not apply_filters(fields, filters):
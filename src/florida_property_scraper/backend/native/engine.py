@@ -14,6 +14,9 @@ from .extract import (
 from florida_property_scraper.feature_flags import get_flags
 from florida_property_scraper.schema.records import normalize_record
 
+SCHEME_PATTERN = re.compile(r"^https?://")
+UNSAFE_FILENAME_PATTERN = re.compile(r"[^a-z0-9]+")
+
 
 class NativeEngine:
     def __init__(
@@ -60,11 +63,12 @@ class NativeEngine:
         first_blocks = []
         global_sem = asyncio.Semaphore(int(os.environ.get("GLOBAL_CONCURRENCY", "10")))
         host_limit = int(os.environ.get("PER_HOST_CONCURRENCY", "2"))
+        batch_size = int(os.environ.get("NATIVE_BATCH_SIZE", "10"))
         host_sems = {}
 
         async def _fetch(req):
             url = req["url"] if isinstance(req, dict) else req
-            host = re.sub(r"^https?://", "", url).split("/")[0]
+            host = SCHEME_PATTERN.sub("", url).split("/")[0]
             if host not in host_sems:
                 host_sems[host] = asyncio.Semaphore(host_limit)
             async with global_sem, host_sems[host]:
@@ -87,7 +91,7 @@ class NativeEngine:
             if remaining is not None:
                 candidate_limit = max(remaining + 2, 0)
             batch = []
-            while queue and len(batch) < int(os.environ.get("NATIVE_BATCH_SIZE", "10")):
+            while queue and len(batch) < batch_size:
                 req = queue.pop(0)
                 req_url = req["url"] if isinstance(req, dict) else req
                 if req_url in visited:
@@ -153,7 +157,9 @@ class NativeEngine:
         if debug_dir:
             os.makedirs(debug_dir, exist_ok=True)
             query = debug_context.get("query", "")
-            safe_query = re.sub(r"[^a-z0-9]+", "_", query.lower()).strip("_") or "query"
+            safe_query = (
+                UNSAFE_FILENAME_PATTERN.sub("_", query.lower()).strip("_") or "query"
+            )
             prefix = f"{county_slug}_{safe_query}"
             if first_html is not None:
                 raw_path = os.path.join(debug_dir, f"{prefix}_raw.html")
@@ -402,7 +408,9 @@ class NativeEngine:
         if debug_dir:
             os.makedirs(debug_dir, exist_ok=True)
             query = debug_context.get("query", "")
-            safe_query = re.sub(r"[^a-z0-9]+", "_", query.lower()).strip("_") or "query"
+            safe_query = (
+                UNSAFE_FILENAME_PATTERN.sub("_", query.lower()).strip("_") or "query"
+            )
             prefix = f"{county_slug}_{safe_query}"
             if first_html is not None:
                 raw_path = os.path.join(debug_dir, f"{prefix}_raw.html")
@@ -23,11 +23,18 @@ REQUIRED_FIELDS = [
     "raw_html",
 ]
 
+WS_PATTERN = re.compile(r"\s+")
+NUMBER_PATTERN = re.compile(r"([0-9]+(\.[0-9]+)?)")
+OWNER_TEXT_PATTERN = re.compile(r"owner\s*[:\-]\s*([^\|]+)", flags=re.IGNORECASE)
+ADDRESS_TEXT_PATTERN = re.compile(
+    r"(mailing|site|situs|property)?\s*address\s*[:\-]\s*([^\|]+)", flags=re.IGNORECASE
+)
+
 
 def norm_ws(value):
     if value is None:
         return ""
-    return re.sub(r"\s+", " ", str(value)).strip()
+    return WS_PATTERN.sub(" ", str(value)).strip()
 
 
 def safe_text(value):
@@ -51,7 +58,7 @@ def pick_first_nonempty(*values):
 
 def parse_numeric_like_fields(text):
     cleaned = norm_ws(text)
-    match = re.search(r"([0-9]+(\.[0-9]+)?)", cleaned)
+    match = NUMBER_PATTERN.search(cleaned)
     return match.group(1) if match else ""
 
 
@@ -89,10 +96,8 @@ def _extract_owner_address_from_pairs(pairs):
 
 def _extract_owner_address_from_text(text):
     combined = safe_text(text)
-    match_owner = re.search(r"owner\s*[:\-]\s*([^\|]+)", combined, re.I)
-    match_addr = re.search(
-        r"(mailing|site|situs|property)?\s*address\s*[:\-]\s*([^\|]+)", combined, re.I
-    )
+    match_owner = OWNER_TEXT_PATTERN.search(combined)
+    match_addr = ADDRESS_TEXT_PATTERN.search(combined)
     owner = safe_text(match_owner.group(1)) if match_owner else ""
     address = safe_text(match_addr.group(2)) if match_addr else ""
     return owner, address
@@ -8,11 +8,8 @@ def compute_property_uid(
     item: Dict[str, object],
 ) -> Tuple[Optional[str], Optional[str], List[str]]:
     warnings: List[str] = []
-    county = (
-        (item.get("county") or "").strip()
-        if isinstance(item.get("county"), str)
-        else ""
-    )
+    county = item.get("county")
+    county = county.strip() if isinstance(county, str) else ""
     if not county:
         warnings.append("Missing county; cannot compute stable property_uid.")
         return None, None, warnings
@@ -20,16 +17,10 @@ def compute_property_uid(
     parcel_id_value = str(parcel_id).strip() if parcel_id not in (None, "") else ""
     if parcel_id_value:
         return f"{county}:{parcel_id_value}", parcel_id_value, warnings
-    situs = (
-        normalize_address(item.get("situs_address"))
-        if isinstance(item.get("situs_address"), str)
-        else ""
-    )
-    owner = (
-        normalize_text(item.get("owner_name"))
-        if isinstance(item.get("owner_name"), str)
-        else ""
-    )
+    situs = item.get("situs_address")
+    situs = normalize_address(situs) if isinstance(situs, str) else ""
+    owner = item.get("owner_name")
+    owner = normalize_text(owner) if isinstance(owner, str) else ""
     fallback_seed = f"{county}|{situs}|{owner}"
     if not situs and not owner:
         warnings.append(
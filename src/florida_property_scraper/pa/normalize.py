@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import MISSING, Field, fields
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from .schema import PAProperty
 
 
+def _field_default(f: Field[Any]) -> Tuple[str, Any, Optional[Callable[[], Any]]]:
+    if f.default is not MISSING:
+        return f.name, f.default, None
+    if f.default_factory is not MISSING:  # type: ignore[comparison-overlap]
+        return f.name, None, f.default_factory  # type: ignore[return-value]
+    return f.name, None, None
+
+
+# (name, default, default_factory) per PAProperty field, resolved once at
+# import instead of walking dataclass metadata for every record.
+_FIELD_DEFAULTS = tuple(_field_default(f) for f in fields(PAProperty))
+
+
 def apply_defaults(partial: Mapping[str, Any] | None) -> PAProperty:
     """Apply the PA canonical defaults to a partial PA dict.
 
@@ -18,23 +31,12 @@ def apply_defaults(partial: Mapping[str, Any] | None) -> PAProperty:
     if partial is None:
         partial = {}
 
-    def _default_for_field(f: Field[Any]) -> Any:
-        if f.default is not MISSING:
-            return f.default
-        if f.default_factory is not MISSING:  # type: ignore[comparison-overlap]
-            return f.default_factory()  # type: ignore[misc]
-        return None
-
     data: Dict[str, Any] = {}
-    for f in fields(PAProperty):
-        default_value = _default_for_field(f)
-        if f.name in partial:
-            value = partial.get(f.name)
-            if value is None:
-                value = default_value
-            data[f.name] = value
-        else:
-            data[f.name] = default_value
+    for name, default_value, default_factory in _FIELD_DEFAULTS:
+        value = partial.get(name)
+        if value is None:
+            value = default_factory() if default_factory is not None else default_value
+        data[name] = value
 
     # Defensive: list fields must never be None.
     if data.get("exemptions") is None:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PAProperty:
     # identifiers
     county: str = ""
@@ -89,4 +89,13 @@ class PAProperty:
     parser_version: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # One pass over the field names instead of asdict()'s recursive
+        # deepcopy; the record is flat, so copying the list fields is enough.
+        out: Dict[str, Any] = {}
+        for name in _FIELD_NAMES:
+            value = getattr(self, name)
+            out[name] = list(value) if isinstance(value, list) else value
+        return out
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(PAProperty))
@@ -5,10 +5,39 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from florida_property_scraper.sqlite_utils import (
+    SCHEMA_PA_V1,
+    mark_schema_current,
+    schema_current,
+)
+
 from .normalize import apply_defaults
 from .schema import PAProperty
 
 
+_UPSERT_SQL = """
+    INSERT INTO pa_properties (
+        county, parcel_id, zip, land_use_code, year_built, building_sf,
+        last_sale_date, last_sale_price, assessed_value, latitude, longitude, record_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(county, parcel_id) DO UPDATE SET
+        zip=excluded.zip,
+        land_use_code=excluded.land_use_code,
+        year_built=excluded.year_built,
+        building_sf=excluded.building_sf,
+        last_sale_date=excluded.last_sale_date,
+        last_sale_price=excluded.last_sale_price,
+        assessed_value=excluded.assessed_value,
+        latitude=excluded.latitude,
+        longitude=excluded.longitude,
+        record_json=excluded.record_json
+"""
+
+# json.dumps builds a fresh encoder per call whenever sort_keys is passed;
+# reuse one. Output is identical to json.dumps(..., sort_keys=True).
+_RECORD_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
 class PASQLite:
     """SQLite persistence for PAProperty records."""
 
@@ -17,6 +46,10 @@ class PASQLite:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.path)
         self.conn.row_factory = sqlite3.Row
+        # The API opens a store per request while scrapers may be writing the
+        # same file; WAL lets those reads proceed without waiting on writers.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
         self._init_schema()
 
     def close(self) -> None:
@@ -25,6 +58,8 @@ class PASQLite:
             self.conn = None
 
     def _init_schema(self) -> None:
+        if schema_current(self.conn, SCHEMA_PA_V1):
+            return
         self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS pa_properties (
@@ -70,48 +105,37 @@ class PASQLite:
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_pa_assessed ON pa_properties(assessed_value)"
         )
+        mark_schema_current(self.conn, SCHEMA_PA_V1)
         self.conn.commit()
 
-    def upsert(self, record: PAProperty) -> None:
-        payload = record.to_dict()
-        self.conn.execute(
-            """
-            INSERT INTO pa_properties (
-                county, parcel_id, zip, land_use_code, year_built, building_sf,
-                last_sale_date, last_sale_price, assessed_value, latitude, longitude, record_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(county, parcel_id) DO UPDATE SET
-                zip=excluded.zip,
-                land_use_code=excluded.land_use_code,
-                year_built=excluded.year_built,
-                building_sf=excluded.building_sf,
-                last_sale_date=excluded.last_sale_date,
-                last_sale_price=excluded.last_sale_price,
-                assessed_value=excluded.assessed_value,
-                latitude=excluded.latitude,
-                longitude=excluded.longitude,
-                record_json=excluded.record_json
-            """,
-            (
-                record.county,
-                record.parcel_id,
-                record.zip,
-                record.land_use_code,
-                int(record.year_built),
-                float(record.building_sf),
-                record.last_sale_date,
-                float(record.last_sale_price),
-                float(record.assessed_value),
-                record.latitude,
-                record.longitude,
-                json.dumps(payload, sort_keys=True),
-            ),
+    @staticmethod
+    def _upsert_params(record: PAProperty) -> Tuple[Any, ...]:
+        return (
+            record.county,
+            record.parcel_id,
+            record.zip,
+            record.land_use_code,
+            int(record.year_built),
+            float(record.building_sf),
+            record.last_sale_date,
+            float(record.last_sale_price),
+            float(record.assessed_value),
+            record.latitude,
+            record.longitude,
+            _RECORD_ENCODER.encode(record.to_dict()),
         )
+
+    def upsert(self, record: PAProperty) -> None:
+        self.conn.execute(_UPSERT_SQL, self._upsert_params(record))
         self.conn.commit()
 
     def upsert_many(self, records: Iterable[PAProperty]) -> None:
-        for r in records:
-            self.upsert(r)
+        # One executemany and one commit for the batch instead of a
+        # commit (and fsync) per record.
+        with self.conn:
+            self.conn.executemany(
+                _UPSERT_SQL, (self._upsert_params(r) for r in records)
+            )
 
     def get(self, *, county: str, parcel_id: str) -> Optional[PAProperty]:
         row = self.conn.execute(
@@ -134,18 +158,20 @@ class PASQLite:
             return {}
 
         placeholders = ",".join(["?"] * len(ids))
+        # Decode rows straight off the cursor rather than materializing a
+        # fetchall() list next to the output dict.
         rows = self.conn.execute(
             f"SELECT parcel_id, record_json FROM pa_properties WHERE county=? AND parcel_id IN ({placeholders})",
             (county, *ids),
-        ).fetchall()
+        )
 
         out: Dict[str, PAProperty] = {}
-        for row in rows:
+        for parcel_id, record_json in rows:
             try:
-                raw = json.loads(row["record_json"])
-            except Exception:
+                raw = json.loads(record_json)
+            except (TypeError, ValueError):
                 continue
-            out[str(row["parcel_id"])] = apply_defaults(raw)
+            out[str(parcel_id)] = apply_defaults(raw)
         return out
 
     def query(
@@ -159,13 +185,31 @@ class PASQLite:
         if where_sql:
             sql += " WHERE " + where_sql
         sql += " ORDER BY county, parcel_id LIMIT ?"
-        rows = self.conn.execute(sql, tuple(params) + (int(limit),)).fetchall()
+        rows = self.conn.execute(sql, tuple(params) + (int(limit),))
         results: List[Tuple[int, PAProperty]] = []
-        for row in rows:
-            raw = json.loads(row["record_json"])
-            results.append((int(row["id"]), apply_defaults(raw)))
+        for row_id, record_json in rows:
+            raw = json.loads(record_json)
+            results.append((int(row_id), apply_defaults(raw)))
         return results
 
+    @staticmethod
+    def hover_fields(rec: PAProperty) -> Dict[str, Any]:
+        """Return the hover-safe fields for one PA record.
+
+        Callers that already hold records from ``get_many`` use this instead
+        of a second ``get_hover_fields_many`` round-trip over the same rows.
+        """
+
+        owner_name = "; ".join([n for n in (rec.owner_names or []) if n])
+        return {
+            "situs_address": rec.situs_address or "",
+            "owner_name": owner_name,
+            "last_sale_date": rec.last_sale_date,
+            "last_sale_price": float(rec.last_sale_price or 0),
+            # PA-only: mortgage fields are unknown unless PA explicitly provides them.
+            "mortgage_amount": None,
+        }
+
     def get_hover_fields_many(
         self,
         *,
@@ -192,23 +236,14 @@ class PASQLite:
         rows = self.conn.execute(
             f"SELECT parcel_id, record_json FROM pa_properties WHERE county=? AND parcel_id IN ({placeholders})",
             (county, *ids),
-        ).fetchall()
+        )
 
         out: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
+        for parcel_id, record_json in rows:
             try:
-                raw = json.loads(row["record_json"])
-            except Exception:
+                raw = json.loads(record_json)
+            except (TypeError, ValueError):
                 continue
-            rec = apply_defaults(raw)
-            owner_name = "; ".join([n for n in (rec.owner_names or []) if n])
-            out[str(row["parcel_id"])] = {
-                "situs_address": rec.situs_address or "",
-                "owner_name": owner_name,
-                "last_sale_date": rec.last_sale_date,
-                "last_sale_price": float(rec.last_sale_price or 0),
-                # PA-only: mortgage fields are unknown unless PA explicitly provides them.
-                "mortgage_amount": None,
-            }
+            out[str(parcel_id)] = self.hover_fields(apply_defaults(raw))
 
         return out
@@ -8,15 +8,22 @@ def _norm_addr(v: Optional[str]) -> str:
     if not v:
         return ""
     # Normalize only for comparison; do not infer new data.
-    return " ".join(str(v).strip().upper().split())
+    return " ".join(str(v).upper().split())
 
 
 def _parse_iso_date(v: Optional[str]) -> Optional[date]:
     if not v:
         return None
+    # PA exports are almost always zero-padded YYYY-MM-DD; fromisoformat
+    # handles that shape without going through strptime's format parser.
+    if isinstance(v, str) and len(v) == 10 and v[4] == "-" and v[7] == "-":
+        try:
+            return date.fromisoformat(v)
+        except ValueError:
+            pass
     try:
         return datetime.strptime(v, "%Y-%m-%d").date()
-    except Exception:
+    except (TypeError, ValueError):
         return None
 
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Protocol, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
 
 
 BBox = Tuple[float, float, float, float]
 
+# Property keys checked, in order, for a feature's parcel id.
+PARCEL_ID_KEYS: Tuple[str, ...] = ("parcel_id", "PARCEL_ID")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Feature:
     """Internal representation for a parcel feature.
 
@@ -57,3 +62,114 @@ def parse_bbox(raw: str) -> BBox:
 
 def feature_id(county: str, parcel_id: str) -> str:
     return f"{county}:{parcel_id}"
+
+
+def first_value(
+    mapping: Dict[str, Any], keys: Sequence[str], default: Any = None
+) -> Any:
+    """Return the first truthy ``mapping[key]`` for ``keys``, else ``default``.
+
+    Same result as a chained ``mapping.get(a) or mapping.get(b) or default``
+    but stops at the first hit.
+    """
+
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            return value
+    return default
+
+
+def shape_bounds(shapes: Sequence[Any]) -> List[Optional[BBox]]:
+    """Return bboxes for Shapely geometries with one vectorized call.
+
+    ``None`` entries and empty geometries map to ``None``. Requires Shapely 2.
+    """
+
+    out: List[Optional[BBox]] = [None] * len(shapes)
+    present = [i for i, g in enumerate(shapes) if g is not None]
+    if not present:
+        return out
+
+    import numpy as np
+    import shapely  # type: ignore[import-not-found]
+
+    arr = np.empty(len(present), dtype=object)
+    arr[:] = [shapes[i] for i in present]
+    for i, (min_x, min_y, max_x, max_y) in zip(present, shapely.bounds(arr).tolist()):
+        if min_x == min_x:  # NaN for empty geometries
+            out[i] = (min_x, min_y, max_x, max_y)
+    return out
+
+
+def _is_line_delimited(fh: Any, ijson: Any) -> bool:
+    """Return True unless the first JSON value in ``fh`` is a collection.
+
+    Reads top-level keys with ``ijson`` only until ``"type"`` or
+    ``"features"`` settles it, so a FeatureCollection is not decoded just to
+    classify it. Empty files count as line-delimited (and yield nothing).
+    """
+
+    ch = fh.read(1)
+    while ch and ch in b"\x1e \t\r\n":
+        ch = fh.read(1)
+    if not ch:
+        return True
+    fh.seek(-1, 1)
+    events = iter(ijson.parse(fh))
+    for prefix, event, value in events:
+        if prefix != "" or event == "start_map":
+            continue
+        if event != "map_key":
+            return event == "end_map"
+        if value == "features":
+            return False
+        if value == "type":
+            return next(events)[2] != "FeatureCollection"
+    return False
+
+
+def iter_geojson_features(path: Path) -> Iterator[Any]:
+    """Yield the features of a GeoJSON file.
+
+    Handles FeatureCollections and line-delimited features, either RFC 8142
+    GeoJSONSeq (each record prefixed with an RS byte) or plain
+    newline-delimited JSON. Line-delimited files are read one line at a time.
+    FeatureCollections are streamed with ``ijson`` when it is installed, so
+    peak memory stays around one feature instead of the whole county file;
+    without it the file is parsed with ``json.loads`` as before.
+    """
+
+    try:
+        import ijson  # type: ignore[import-not-found]
+    except Exception:
+        ijson = None
+
+    with path.open("rb") as fh:
+        if ijson is not None:
+            line_delimited = _is_line_delimited(fh, ijson)
+            fh.seek(0)
+            if not line_delimited:
+                yield from ijson.items(fh, "features.item", use_float=True)
+                return
+
+        lines = (line.strip(b"\x1e \t\r\n") for line in fh)
+        lines = (line for line in lines if line)
+        first = next(lines, None)
+        if first is None:
+            return
+        try:
+            raw = json.loads(first)
+        except ValueError:
+            # A multi-line document, e.g. a pretty-printed FeatureCollection.
+            fh.seek(0)
+            raw = json.loads(fh.read().decode("utf-8"))
+        if isinstance(raw, dict) and "features" not in raw:
+            yield raw
+            for line in lines:
+                yield json.loads(line)
+            return
+
+    feats = raw.get("features") if isinstance(raw, dict) else None
+    if isinstance(feats, list):
+        yield from feats
@@ -34,6 +34,10 @@ def geometry_bbox(geometry: Dict[str, Any]) -> Optional[BBox]:
     return (min(xs), min(ys), max(xs), max(ys))
 
 
+def bbox_intersects(a: BBox, b: BBox) -> bool:
+    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+
 def circle_polygon(
     *, center_lon: float, center_lat: float, miles: float, steps: int = 36
 ) -> Dict[str, Any]:
@@ -89,4 +93,4 @@ def intersects(
     b = geometry_bbox(feature_geometry)
     if a is None or b is None:
         return False
-    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+    return bbox_intersects(a, b)
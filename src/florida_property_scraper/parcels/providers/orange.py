@@ -1,11 +1,30 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from florida_property_scraper.parcels.geometry_provider import BBox, Feature, feature_id
+from typing import Any, Dict, List, Tuple
+
+from florida_property_scraper.parcels.geometry_provider import (
+    PARCEL_ID_KEYS,
+    BBox,
+    Feature,
+    feature_id,
+    first_value,
+    iter_geojson_features,
+    shape_bounds,
+)
+from florida_property_scraper.parcels.geometry_search import (
+    bbox_intersects,
+    geometry_bbox,
+)
+
+# Orange exports use several spellings; keys are checked in order.
+_ORANGE_PARCEL_ID_KEYS = ("parcel_id", "PARCEL_ID", "PARCELID", "folio", "FOLIO")
+_SITUS_KEYS = ("situs", "SITUS", "situs_address")
+_OWNER_KEYS = ("owner", "OWNER", "owner_name")
+_SALE_PRICE_KEYS = ("sale_price", "SALE_PRICE", "last_sale_price")
+_SALE_DATE_KEYS = ("sale_date", "SALE_DATE", "last_sale_date")
+_MORTGAGE_KEYS = ("mortgage_amount", "MORTGAGE_AMOUNT")
 
 
 @dataclass
@@ -29,6 +48,7 @@ class OrangeProvider:
     _features: List[Feature] = None  # type: ignore[assignment]
     _geoms: List[Any] = None  # shapely geometries (optional)
     _tree: Any = None  # STRtree (optional)
+    _tree_index: List[int] = None  # type: ignore[assignment]
     _bboxes: List[BBox] = None  # type: ignore[assignment]
 
     # Optional normalized metadata keyed by parcel_id. Not used by /api/parcels.
@@ -43,6 +63,7 @@ class OrangeProvider:
         self._features = []
         self._geoms = []
         self._tree = None
+        self._tree_index = []
         self._bboxes = []
         self._meta = {}
 
@@ -50,11 +71,7 @@ class OrangeProvider:
             self._loaded = True
             return
 
-        raw = json.loads(self.geojson_path.read_text(encoding="utf-8"))
-        feats = raw.get("features") if isinstance(raw, dict) else None
-        if not isinstance(feats, list):
-            self._loaded = True
-            return
+        feats = iter_geojson_features(self.geojson_path)
 
         has_shapely = True
         try:
@@ -63,6 +80,9 @@ class OrangeProvider:
         except Exception:
             has_shapely = False
 
+        # (feature, shapely geometry or None, meta); bboxes are computed in one
+        # pass after the loop so Shapely can measure every geometry in one call.
+        pending: List[Tuple[Feature, Any, Dict[str, Any]]] = []
         for feat in feats:
             if not isinstance(feat, dict):
                 continue
@@ -76,41 +96,21 @@ class OrangeProvider:
                 else {}
             )
 
-            parcel_id = (
-                props.get("parcel_id")
-                or props.get("PARCEL_ID")
-                or props.get("PARCELID")
-                or props.get("folio")
-                or props.get("FOLIO")
-                or feat.get("parcel_id")
-                or feat.get("PARCEL_ID")
+            parcel_id = first_value(props, _ORANGE_PARCEL_ID_KEYS) or first_value(
+                feat, PARCEL_ID_KEYS
             )
             if not parcel_id:
                 continue
             parcel_id = str(parcel_id)
 
             # Normalize commonly-seen Orange fields to a stable internal shape.
-            self._meta[parcel_id] = {
+            meta = {
                 "parcel_id": parcel_id,
-                "situs": props.get("situs")
-                or props.get("SITUS")
-                or props.get("situs_address")
-                or "",
-                "owner": props.get("owner")
-                or props.get("OWNER")
-                or props.get("owner_name")
-                or "",
-                "sale_price": props.get("sale_price")
-                or props.get("SALE_PRICE")
-                or props.get("last_sale_price")
-                or 0,
-                "sale_date": props.get("sale_date")
-                or props.get("SALE_DATE")
-                or props.get("last_sale_date")
-                or None,
-                "mortgage_amount": props.get("mortgage_amount")
-                or props.get("MORTGAGE_AMOUNT")
-                or 0,
+                "situs": first_value(props, _SITUS_KEYS, ""),
+                "owner": first_value(props, _OWNER_KEYS, ""),
+                "sale_price": first_value(props, _SALE_PRICE_KEYS, 0),
+                "sale_date": first_value(props, _SALE_DATE_KEYS),
+                "mortgage_amount": first_value(props, _MORTGAGE_KEYS, 0),
             }
 
             sgeom = None
@@ -126,55 +126,31 @@ class OrangeProvider:
                 parcel_id=parcel_id,
                 geometry=geom,
             )
-            self._features.append(f)
+            pending.append((f, sgeom, meta))
 
-            bb = self._bbox_from_geometry(geom)
+        bounds = shape_bounds([g for _, g, _ in pending]) if has_shapely else []
+        for i, (f, sgeom, meta) in enumerate(pending):
+            self._meta[f.parcel_id] = meta
+            bb = bounds[i] if sgeom is not None else None
+            if bb is None:
+                bb = geometry_bbox(f.geometry)
             if bb is None:
-                self._features.pop()
-                self._meta.pop(parcel_id, None)
+                self._meta.pop(f.parcel_id, None)
                 continue
+            self._features.append(f)
             self._bboxes.append(bb)
-
             self._geoms.append(sgeom)
 
         if has_shapely:
-            valid = [g for g in self._geoms if g is not None]
-            if valid:
-                self._tree = STRtree(valid)
+            # Build the STRtree once, after the bulk load, over valid geometries
+            # only; keep the tree-position -> feature-index map alongside it so
+            # query() does not rebuild it per request.
+            self._tree_index = [i for i, g in enumerate(self._geoms) if g is not None]
+            if self._tree_index:
+                self._tree = STRtree([self._geoms[i] for i in self._tree_index])
 
         self._loaded = True
 
-    @staticmethod
-    def _bbox_from_geometry(geom: Dict[str, Any]) -> Optional[BBox]:
-        coords = geom.get("coordinates")
-        if coords is None:
-            return None
-
-        def _walk(obj: Any):
-            if (
-                isinstance(obj, (list, tuple))
-                and len(obj) == 2
-                and all(isinstance(x, (int, float)) for x in obj)
-            ):
-                yield float(obj[0]), float(obj[1])
-                return
-            if isinstance(obj, (list, tuple)):
-                for it in obj:
-                    yield from _walk(it)
-
-        xs: List[float] = []
-        ys: List[float] = []
-        for x, y in _walk(coords):
-            xs.append(x)
-            ys.append(y)
-        if not xs or not ys:
-            return None
-        return (min(xs), min(ys), max(xs), max(ys))
-
-    @staticmethod
-    def _bbox_intersects(a: BBox, b: BBox) -> bool:
-        return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
-
     def query(self, bbox: BBox) -> List[Feature]:
         if not self._loaded:
             self.load()
@@ -203,20 +179,13 @@ class OrangeProvider:
                 # - array of geometry objects
                 first = candidates[0]
 
-                idx_by_id = {}
-                for i, g in enumerate(self._geoms):
-                    if g is not None:
-                        idx_by_id[id(g)] = i
-
                 out: List[Feature] = []
                 # Index-returning path (common in shapely 2.x builds)
                 if isinstance(first, (int,)) or first.__class__.__name__ in (
                     "int64",
                     "int32",
                 ):
-                    valid_indices = [
-                        i for i, g in enumerate(self._geoms) if g is not None
-                    ]
+                    valid_indices = self._tree_index
                     for v in candidates:
                         try:
                             tree_idx = int(v)
@@ -235,6 +204,7 @@ class OrangeProvider:
                             continue
                         out.append(self._features[feat_idx])
                 else:
+                    idx_by_id = {id(self._geoms[i]): i for i in self._tree_index}
                     for g in candidates:
                         i = idx_by_id.get(id(g))
                         if i is None:
@@ -250,7 +220,7 @@ class OrangeProvider:
 
         out: List[Feature] = []
         for i, bb in enumerate(self._bboxes):
-            if self._bbox_intersects(bbox, bb):
+            if bbox_intersects(bbox, bb):
                 out.append(self._features[i])
         out.sort(key=lambda f: f.parcel_id)
         return out
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from florida_property_scraper.parcels.geometry_provider import BBox, Feature, feature_id
+from typing import Any, List, Tuple
+
+from florida_property_scraper.parcels.geometry_provider import (
+    PARCEL_ID_KEYS,
+    BBox,
+    Feature,
+    feature_id,
+    first_value,
+    iter_geojson_features,
+    shape_bounds,
+)
+from florida_property_scraper.parcels.geometry_search import (
+    bbox_intersects,
+    geometry_bbox,
+)
 
 
 @dataclass
@@ -23,6 +34,7 @@ class SeminoleProvider:
     _features: List[Feature] = None  # type: ignore[assignment]
     _geoms: List[Any] = None  # shapely geometries (optional)
     _tree: Any = None  # STRtree (optional)
+    _tree_index: List[int] = None  # type: ignore[assignment]
     _bboxes: List[BBox] = None  # type: ignore[assignment]
 
     def load(self) -> None:
@@ -34,17 +46,14 @@ class SeminoleProvider:
         self._features = []
         self._geoms = []
         self._tree = None
+        self._tree_index = []
         self._bboxes = []
 
         if not self.geojson_path.exists():
             self._loaded = True
             return
 
-        raw = json.loads(self.geojson_path.read_text(encoding="utf-8"))
-        feats = raw.get("features") if isinstance(raw, dict) else None
-        if not isinstance(feats, list):
-            self._loaded = True
-            return
+        feats = iter_geojson_features(self.geojson_path)
 
         has_shapely = True
         try:
@@ -53,6 +62,9 @@ class SeminoleProvider:
         except Exception:
             has_shapely = False
 
+        # (feature, shapely geometry or None); bboxes are computed in one pass
+        # after the loop so Shapely can measure every geometry in a single call.
+        pending: List[Tuple[Feature, Any]] = []
         for feat in feats:
             if not isinstance(feat, dict):
                 continue
@@ -64,11 +76,8 @@ class SeminoleProvider:
                 if isinstance(feat.get("properties"), dict)
                 else {}
             )
-            parcel_id = (
-                props.get("parcel_id")
-                or props.get("PARCEL_ID")
-                or feat.get("parcel_id")
-                or feat.get("PARCEL_ID")
+            parcel_id = first_value(props, PARCEL_ID_KEYS) or first_value(
+                feat, PARCEL_ID_KEYS
             )
             if not parcel_id:
                 continue
@@ -87,60 +96,31 @@ class SeminoleProvider:
                 parcel_id=parcel_id,
                 geometry=geom,
             )
-            self._features.append(f)
+            pending.append((f, sgeom))
 
-            # Always compute bbox for fallback + quick rejection.
-            bb = self._bbox_from_geometry(geom)
+        bounds = shape_bounds([g for _, g in pending]) if has_shapely else []
+        for i, (f, sgeom) in enumerate(pending):
+            # Always keep a bbox for fallback + quick rejection.
+            bb = bounds[i] if sgeom is not None else None
+            if bb is None:
+                bb = geometry_bbox(f.geometry)
             if bb is None:
                 # If we can't compute a bbox, skip it (can't query reliably).
-                self._features.pop()
                 continue
+            self._features.append(f)
             self._bboxes.append(bb)
-
-            if sgeom is not None:
-                self._geoms.append(sgeom)
-            else:
-                self._geoms.append(None)
+            self._geoms.append(sgeom)
 
         if has_shapely:
-            # Build STRtree only on valid geometries.
-            valid = [g for g in self._geoms if g is not None]
-            if valid:
-                self._tree = STRtree(valid)
+            # Build the STRtree once, after the bulk load, over valid geometries
+            # only; keep the tree-position -> feature-index map alongside it so
+            # query() does not rebuild it per request.
+            self._tree_index = [i for i, g in enumerate(self._geoms) if g is not None]
+            if self._tree_index:
+                self._tree = STRtree([self._geoms[i] for i in self._tree_index])
 
         self._loaded = True
 
-    @staticmethod
-    def _bbox_from_geometry(geom: Dict[str, Any]) -> Optional[BBox]:
-        coords = geom.get("coordinates")
-        if coords is None:
-            return None
-
-        def _walk(obj: Any):
-            if (
-                isinstance(obj, (list, tuple))
-                and len(obj) == 2
-                and all(isinstance(x, (int, float)) for x in obj)
-            ):
-                yield float(obj[0]), float(obj[1])
-                return
-            if isinstance(obj, (list, tuple)):
-                for it in obj:
-                    yield from _walk(it)
-
-        xs: List[float] = []
-        ys: List[float] = []
-        for x, y in _walk(coords):
-            xs.append(x)
-            ys.append(y)
-        if not xs or not ys:
-            return None
-        return (min(xs), min(ys), max(xs), max(ys))
-
-    @staticmethod
-    def _bbox_intersects(a: BBox, b: BBox) -> bool:
-        return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
-
     def query(self, bbox: BBox) -> List[Feature]:
         if not self._loaded:
             self.load()
@@ -177,9 +157,7 @@ class SeminoleProvider:
                     "int64",
                     "int32",
                 ):
-                    valid_indices = [
-                        i for i, g in enumerate(self._geoms) if g is not None
-                    ]
+                    valid_indices = self._tree_index
                     for v in candidates:
                         try:
                             tree_idx = int(v)
@@ -198,11 +176,7 @@ class SeminoleProvider:
                             continue
                         out.append(self._features[feat_idx])
                 else:
-                    idx_by_id = {}
-                    for i, g in enumerate(self._geoms):
-                        if g is not None:
-                            idx_by_id[id(g)] = i
-
+                    idx_by_id = {id(self._geoms[i]): i for i in self._tree_index}
                     for g in candidates:
                         i = idx_by_id.get(id(g))
                         if i is None:
@@ -219,7 +193,7 @@ class SeminoleProvider:
         # Fallback: bbox-only index (still avoids per-feature geometry parsing).
         out: List[Feature] = []
         for i, bb in enumerate(self._bboxes):
-            if self._bbox_intersects(bbox, bb):
+            if bbox_intersects(bbox, bb):
                 out.append(self._features[i])
         out.sort(key=lambda f: f.parcel_id)
         return out
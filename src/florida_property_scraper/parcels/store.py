@@ -7,6 +7,11 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from florida_property_scraper.cache import cache_get, cache_set
+from florida_property_scraper.parcels.geometry_provider import (
+    PARCEL_ID_KEYS,
+    first_value,
+)
+from florida_property_scraper.parcels.geometry_search import bbox_intersects
 
 
 BBox = Tuple[float, float, float, float]
@@ -22,10 +27,6 @@ def parse_bbox(raw: str) -> BBox:
     return (min_lon, min_lat, max_lon, max_lat)
 
 
-def _bbox_intersects(a: BBox, b: BBox) -> bool:
-    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
-
-
 def _geom_bbox(geom: Dict[str, Any]) -> Optional[BBox]:
     gtype = (geom or {}).get("type")
     coords = (geom or {}).get("coordinates")
@@ -120,7 +121,7 @@ class FileGeoJSONParcelGeometryStore:
             gb = _geom_bbox(geom)
             if gb is None:
                 continue
-            if not _bbox_intersects(bbox, gb):
+            if not bbox_intersects(bbox, gb):
                 continue
 
             props = (
@@ -128,12 +129,8 @@ class FileGeoJSONParcelGeometryStore:
                 if isinstance(feat.get("properties"), dict)
                 else {}
             )
-            parcel_id = (
-                props.get("parcel_id")
-                or props.get("PARCEL_ID")
-                or feat.get("parcel_id")
-                or feat.get("PARCEL_ID")
-                or ""
+            parcel_id = first_value(props, PARCEL_ID_KEYS) or first_value(
+                feat, PARCEL_ID_KEYS, ""
             )
             parcel_id = str(parcel_id)
             if not parcel_id:
@@ -1,8 +1,13 @@
 import re
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 from florida_property_scraper.routers.fl_coverage import FL_COUNTIES
 
+_SEPARATOR_RE = re.compile(r"[\s\-]+")
+_INVALID_CHARS_RE = re.compile(r"[^a-z0-9_]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
 
 def _flatten_entry(entry: dict) -> dict:
     flattened = dict(entry)
@@ -23,13 +28,14 @@ def _flatten_entry(entry: dict) -> dict:
 _ENTRIES = {entry["slug"]: _flatten_entry(entry) for entry in FL_COUNTIES}
 
 
+@lru_cache(maxsize=1024)
 def canonicalize_jurisdiction_name(name: str) -> str:
     if not name:
         return ""
     cleaned = name.strip().lower()
-    cleaned = re.sub(r"[\s\-]+", "_", cleaned)
-    cleaned = re.sub(r"[^a-z0-9_]", "", cleaned)
-    cleaned = re.sub(r"_+", "_", cleaned).strip("_")
+    cleaned = _SEPARATOR_RE.sub("_", cleaned)
+    cleaned = _INVALID_CHARS_RE.sub("", cleaned)
+    cleaned = _UNDERSCORE_RUN_RE.sub("_", cleaned).strip("_")
     return cleaned
 
 
@@ -4,17 +4,20 @@ import re
 
 REQUIRED_FIELDS = ["state", "county", "jurisdiction", "owner", "address", "raw_html"]
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def strip_html(value: str) -> str:
     if value is None:
         return ""
-    return re.sub(r"<[^>]+>", "", str(value))
+    return _TAG_RE.sub("", str(value))
 
 
 def clean_text(value: str) -> str:
     if value is None:
         return ""
-    return re.sub(r"\s+", " ", str(value)).strip()
+    return _WHITESPACE_RE.sub(" ", str(value)).strip()
 
 
 def is_html_like(text: str) -> bool:
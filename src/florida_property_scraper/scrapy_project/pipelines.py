@@ -78,11 +78,19 @@ class StoragePipeline:
         return cls(SQLiteStore(path), run_id)
 
     def process_item(self, item: Dict[str, Any], spider=None):
+        # One commit per item for the lead, observation and events. The write
+        # lock is released before the next request, so the API and PA ingest
+        # can write to the same database while a crawl runs.
+        with self.store.transaction():
+            self._store_item(item)
+        return item
+
+    def _store_item(self, item: Dict[str, Any]) -> None:
         record = normalize_record(dict(item))
         self.store.upsert_lead(record)
         property_uid, parcel_id, warnings = compute_property_uid(item)
         if not property_uid:
-            return item
+            return
         observed_at = datetime.now(timezone.utc).isoformat()
         old_obs = self.store.get_latest_observation(property_uid)
         purchase_history = item.get("purchase_history") or []
@@ -105,7 +113,6 @@ class StoragePipeline:
         self.store.insert_observation(observation)
         events = generate_events(old_obs, observation)
         self.store.insert_events(events)
-        return item
 
     def close_spider(self, spider):
         self.store.close()
@@ -16,6 +16,9 @@ from florida_property_scraper.arcgis import (
 from florida_property_scraper.county_sources import COUNTY_SOURCES
 from florida_property_scraper.scrapy_project.items import PropertyItem
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_VALUE_SPLIT_RE = re.compile(r"[,;/]|\s{2,}")
+
 LABEL_PATTERNS = {
     "owner_name": ["owner", "owner name", "property owner"],
     "mailing_address": ["mailing address", "mailing"],
@@ -1420,17 +1423,17 @@ class CountySpider(scrapy.Spider):
         return None
 
     def _normalize_label(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text.strip().lower())
+        return _WHITESPACE_RE.sub(" ", text.strip().lower())
 
     def _clean_text(self, value: Any) -> str:
         if isinstance(value, list):
             value = " ".join(value)
-        return re.sub(r"\s+", " ", str(value)).strip()
+        return _WHITESPACE_RE.sub(" ", str(value)).strip()
 
     def _split_values(self, value: str) -> List[str]:
         if not value:
             return []
-        parts = re.split(r"[,;/]|\s{2,}", value)
+        parts = _VALUE_SPLIT_RE.split(value)
         return [p.strip() for p in parts if p.strip()]
 
     def _format_hcpafl_mailing_address(self, mailing: Dict[str, Any]) -> str:
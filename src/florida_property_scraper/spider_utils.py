@@ -4,6 +4,8 @@ from urllib.parse import urlsplit, urlunsplit, parse_qs, urlencode
 from florida_property_scraper.schema import REQUIRED_FIELDS, normalize_item
 
 
+ADDRESS_LIKE_PATTERN = re.compile(r"\\d+\\s+\\S+")
+
 LABEL_OWNER = ["owner", "owner name", "owner(s)", "property owner"]
 LABEL_ADDRESS = [
     "mailing address",
@@ -54,7 +56,7 @@ def _find_value(lines, labels):
 
 def _find_address_like(lines):
     for line in lines:
-        if re.match(r"\\d+\\s+\\S+", line):
+        if ADDRESS_LIKE_PATTERN.match(line):
             return line
     return ""
 
@@ -63,9 +65,9 @@ def extract_label_items_from_nodes(nodes, county):
     items = []
     for container in nodes:
         lines = [
-            normalize_text(t)
-            for t in container.css("::text").getall()
-            if normalize_text(t)
+            line
+            for line in map(normalize_text, container.css("::text").getall())
+            if line
         ]
         owner = _find_value(lines, LABEL_OWNER)
         address = _find_value(lines, LABEL_ADDRESS)
@@ -95,9 +97,9 @@ def extract_label_items(response, county):
     if items:
         return items
     texts = [
-        normalize_text(t)
-        for t in response.css("body ::text").getall()
-        if normalize_text(t)
+        text
+        for text in map(normalize_text, response.css("body ::text").getall())
+        if text
     ]
     owner = _find_value(texts, LABEL_OWNER)
     address = _find_value(texts, LABEL_ADDRESS)
@@ -0,0 +1,66 @@
+"""Helpers shared by the SQLite-backed stores."""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+# PRAGMA user_version is shared by every store that opens the same file
+# (leads.sqlite by default), so each schema owns one bit of it. Bump to a new
+# bit when a schema changes so older files re-run their migrations once.
+SCHEMA_PROPERTIES_V1 = 1 << 0
+SCHEMA_LEADS_V1 = 1 << 1
+SCHEMA_PA_V1 = 1 << 2
+
+
+def schema_current(conn: sqlite3.Connection, flag: int) -> bool:
+    return bool(conn.execute("PRAGMA user_version").fetchone()[0] & flag)
+
+
+def mark_schema_current(conn: sqlite3.Connection, flag: int) -> None:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.execute(f"PRAGMA user_version = {int(version) | flag}")
+
+
+class TransactionMixin:
+    """Adds :meth:`transaction` to a store that keeps its connection in ``conn``.
+
+    Store methods should skip their own ``commit()`` while
+    ``self._in_transaction`` is set.
+    """
+
+    conn: sqlite3.Connection
+    _in_transaction = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit every write made inside the block once, at the end.
+
+        On error the block's writes are rolled back together. A nested block
+        runs as a savepoint: an error inside it undoes only its own writes,
+        and its work commits with the outer block.
+        """
+        if self._in_transaction:
+            self.conn.execute("SAVEPOINT nested")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK TO nested")
+                self.conn.execute("RELEASE nested")
+                raise
+            else:
+                self.conn.execute("RELEASE nested")
+            return
+        self._in_transaction = True
+        # Explicit BEGIN so a savepoint opened first cannot become (and, on
+        # release, commit) the outer transaction.
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
@@ -1,9 +1,74 @@
 import json
 import sqlite3
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from florida_property_scraper.schema import normalize_item
+from florida_property_scraper.sqlite_utils import (
+    SCHEMA_LEADS_V1,
+    SCHEMA_PROPERTIES_V1,
+    TransactionMixin,
+    mark_schema_current,
+    schema_current,
+)
+
+_PROPERTY_FIELDS = (
+    "state",
+    "jurisdiction",
+    "county",
+    "address",
+    "land_size",
+    "building_size",
+    "bedrooms",
+    "bathrooms",
+    "zoning",
+    "property_class",
+    "raw_html",
+)
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups.
+_SQL_IN_CHUNK = 500
+
+# normalize_item() guarantees every property field is present.
+_property_values = itemgetter(*_PROPERTY_FIELDS)
+
+# normalize_record() guarantees every scalar lead field is present.
+_LEAD_SCALAR_FIELDS = (
+    "dedupe_key",
+    "county",
+    "search_query",
+    "owner_name",
+    "mailing_address",
+    "situs_address",
+    "parcel_id",
+    "property_url",
+    "source_url",
+    "zoning_current",
+    "zoning_future",
+    "lead_score",
+    "captured_at",
+)
+_lead_scalars = itemgetter(*_LEAD_SCALAR_FIELDS)
+
+# Map up to 256 MiB of the database file so the observation/event lookups
+# read pages via page faults instead of read(2) + copy.
+_MMAP_SIZE = 256 * 1024 * 1024
+# Only takes effect while the file is still empty (before the first table).
+_PAGE_SIZE = 8192
+# Negative cache_size is in KiB: keep ~20 MB of hot pages per connection.
+_CACHE_SIZE = -20000
+
+_LEAD_JSON_FIELDS = (
+    "contact_phones",
+    "contact_emails",
+    "contact_addresses",
+    "mortgage",
+    "purchase_history",
+)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=True)
 
 
 class SQLiteStorage:
@@ -13,6 +78,8 @@ class SQLiteStorage:
         self._create_tables()
 
     def _create_tables(self):
+        if schema_current(self.conn, SCHEMA_PROPERTIES_V1):
+            return
         cur = self.conn.cursor()
         cur.execute(
             """
@@ -49,54 +116,50 @@ class SQLiteStorage:
             cur.execute("ALTER TABLE properties ADD COLUMN state TEXT")
         if "jurisdiction" not in columns:
             cur.execute("ALTER TABLE properties ADD COLUMN jurisdiction TEXT")
+        mark_schema_current(self.conn, SCHEMA_PROPERTIES_V1)
         self.conn.commit()
 
     def save_items(self, items):
+        normalized = [normalize_item(item) for item in items]
+        if not normalized:
+            return
         cur = self.conn.cursor()
-        for item in items:
-            normalized = normalize_item(item)
-            owner_name = normalized.get("owner", "")
-            cur.execute(
-                "INSERT OR IGNORE INTO owners (name) VALUES (?)",
-                (owner_name,),
-            )
-            cur.execute("SELECT id FROM owners WHERE name = ?", (owner_name,))
-            row = cur.fetchone()
-            if not row:
-                continue
-            owner_id = row[0]
+        owner_names = list(dict.fromkeys(record["owner"] for record in normalized))
+        cur.executemany(
+            "INSERT OR IGNORE INTO owners (name) VALUES (?)",
+            [(name,) for name in owner_names],
+        )
+        owner_ids = {}
+        for start in range(0, len(owner_names), _SQL_IN_CHUNK):
+            chunk = owner_names[start : start + _SQL_IN_CHUNK]
+            placeholders = ",".join(["?"] * len(chunk))
             cur.execute(
-                """
-                INSERT OR IGNORE INTO properties (
-                    state,
-                    jurisdiction,
-                    county,
-                    owner_id,
-                    address,
-                    land_size,
-                    building_size,
-                    bedrooms,
-                    bathrooms,
-                    zoning,
-                    property_class,
-                    raw_html
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    normalized.get("state", "fl"),
-                    normalized.get("jurisdiction", normalized.get("county", "")),
-                    normalized.get("county", ""),
-                    owner_id,
-                    normalized.get("address", ""),
-                    normalized.get("land_size", ""),
-                    normalized.get("building_size", ""),
-                    normalized.get("bedrooms", ""),
-                    normalized.get("bathrooms", ""),
-                    normalized.get("zoning", ""),
-                    normalized.get("property_class", ""),
-                    normalized.get("raw_html", ""),
-                ),
+                f"SELECT id, name FROM owners WHERE name IN ({placeholders})", chunk
             )
+            owner_ids.update((name, owner_id) for owner_id, name in cur)
+        cur.executemany(
+            """
+            INSERT OR IGNORE INTO properties (
+                owner_id,
+                state,
+                jurisdiction,
+                county,
+                address,
+                land_size,
+                building_size,
+                bedrooms,
+                bathrooms,
+                zoning,
+                property_class,
+                raw_html
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (owner_ids[record["owner"]], *_property_values(record))
+                for record in normalized
+                if record["owner"] in owner_ids
+            ],
+        )
         self.conn.commit()
 
     def close(self):
@@ -105,15 +168,39 @@ class SQLiteStorage:
             self.conn = None
 
 
-class SQLiteStore:
+class SQLiteStore(TransactionMixin):
+    """SQLite persistence for leads, runs, observations and events.
+
+    Each write commits on its own unless it runs inside :meth:`transaction`,
+    which lets callers such as the Scrapy pipeline commit many items at once.
+    """
+
     def __init__(self, path: str):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.path)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
         self._init_schema()
+        # WAL is switched on after the schema so _PAGE_SIZE still applies to a
+        # new file; readers (API, exporters) then no longer block the writer.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute(f"PRAGMA cache_size = {_CACHE_SIZE}")
+
+    def _write(self, sql: str, params: Sequence[Any]) -> None:
+        self._write_many(sql, [params])
+
+    def _write_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        self.conn.executemany(sql, rows)
+        if not self._in_transaction:
+            self.conn.commit()
 
     def _init_schema(self) -> None:
+        if schema_current(self.conn, SCHEMA_LEADS_V1):
+            return
+        self.conn.execute(f"PRAGMA page_size = {_PAGE_SIZE}")
         self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS leads (
@@ -200,6 +287,7 @@ class SQLiteStore:
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_events_property_time ON events(property_uid, event_at DESC)"
         )
+        mark_schema_current(self.conn, SCHEMA_LEADS_V1)
         self.conn.commit()
 
     def record_run_start(
@@ -210,7 +298,7 @@ class SQLiteStore:
         counties: Optional[List[str]],
         query: str,
     ) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT INTO runs (
                 run_id,
@@ -243,7 +331,6 @@ class SQLiteStore:
                 json.dumps([], ensure_ascii=True),
             ),
         )
-        self.conn.commit()
 
     def record_run_finish(
         self,
@@ -254,7 +341,7 @@ class SQLiteStore:
         warnings: List[str],
         errors: List[str],
     ) -> None:
-        self.conn.execute(
+        self._write(
             """
             UPDATE runs
             SET finished_at = ?,
@@ -273,51 +360,35 @@ class SQLiteStore:
                 run_id,
             ),
         )
-        self.conn.commit()
 
     def upsert_lead(self, record: Dict[str, Any]) -> None:
+        encoded = {field: _dumps(record.get(field, [])) for field in _LEAD_JSON_FIELDS}
         payload = (
-            record.get("dedupe_key"),
-            record.get("county"),
-            record.get("search_query"),
-            record.get("owner_name"),
-            json.dumps(record.get("contact_phones", []), ensure_ascii=True),
-            json.dumps(record.get("contact_emails", []), ensure_ascii=True),
-            json.dumps(record.get("contact_addresses", []), ensure_ascii=True),
-            record.get("mailing_address"),
-            record.get("situs_address"),
-            record.get("parcel_id"),
-            record.get("property_url"),
-            record.get("source_url"),
-            json.dumps(record.get("mortgage", []), ensure_ascii=True),
-            json.dumps(record.get("purchase_history", []), ensure_ascii=True),
-            record.get("zoning_current"),
-            record.get("zoning_future"),
-            record.get("lead_score"),
-            record.get("captured_at"),
-            json.dumps(record, ensure_ascii=True),
+            *_lead_scalars(record),
+            *encoded.values(),
+            _dumps(record),
         )
-        self.conn.execute(
+        self._write(
             """
             INSERT INTO leads (
                 dedupe_key,
                 county,
                 search_query,
                 owner_name,
-                contact_phones,
-                contact_emails,
-                contact_addresses,
                 mailing_address,
                 situs_address,
                 parcel_id,
                 property_url,
                 source_url,
-                mortgage,
-                purchase_history,
                 zoning_current,
                 zoning_future,
                 lead_score,
                 captured_at,
+                contact_phones,
+                contact_emails,
+                contact_addresses,
+                mortgage,
+                purchase_history,
                 raw_json
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -343,7 +414,6 @@ class SQLiteStore:
             """,
             payload,
         )
-        self.conn.commit()
 
     def get_latest_observation(self, property_uid: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -358,7 +428,7 @@ class SQLiteStore:
         return dict(row) if row else None
 
     def insert_observation(self, record: Dict[str, Any]) -> None:
-        self.conn.execute(
+        self._write(
             """
             INSERT INTO observations (
                 property_uid,
@@ -393,12 +463,11 @@ class SQLiteStore:
                 record.get("run_id"),
             ),
         )
-        self.conn.commit()
 
     def insert_events(self, events: List[Dict[str, Any]]) -> None:
         if not events:
             return
-        self.conn.executemany(
+        self._write_many(
             """
             INSERT INTO events (
                 property_uid,
@@ -426,7 +495,6 @@ class SQLiteStore:
                 for event in events
             ],
         )
-        self.conn.commit()
 
     def close(self) -> None:
         self.conn.close()
@@ -5,10 +5,43 @@ import sqlite3
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from florida_property_scraper.sqlite_utils import TransactionMixin
 
-@dataclass(frozen=True)
+
+_GET_SQL = (
+    "SELECT county, parcel_id, starred, tags_json, notes, lists_json, updated_at"
+    " FROM user_meta WHERE county=? AND parcel_id=?"
+)
+
+_UPSERT_SQL = """
+    INSERT INTO user_meta (county, parcel_id, starred, tags_json, notes, lists_json, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(county, parcel_id) DO UPDATE SET
+        starred=excluded.starred,
+        tags_json=excluded.tags_json,
+        notes=excluded.notes,
+        lists_json=excluded.lists_json,
+        updated_at=excluded.updated_at
+"""
+
+
+def _encode_list(values: List[str]) -> str:
+    # Most parcels carry no tags or lists; skip the encoder for those.
+    return json.dumps(values, sort_keys=True) if values else "[]"
+
+
+def _decode_list(raw: Any) -> Any:
+    if not raw or raw == "[]":
+        return []
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return []
+
+
+@dataclass(frozen=True, slots=True)
 class UserMeta:
     county: str
     parcel_id: str
@@ -30,7 +63,7 @@ class UserMeta:
         }
 
 
-class UserMetaSQLite:
+class UserMetaSQLite(TransactionMixin):
     """SQLite persistence for user-managed parcel metadata."""
 
     def __init__(self, path: str) -> None:
@@ -38,6 +71,9 @@ class UserMetaSQLite:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.path)
         self.conn.row_factory = sqlite3.Row
+        # Same settings as PASQLite: API requests read while edits land.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
         self._init_schema()
 
     def close(self) -> None:
@@ -71,45 +107,39 @@ class UserMetaSQLite:
             return []
         if isinstance(values, str):
             # allow comma-separated strings
-            return [v.strip() for v in values.split(",") if v.strip()]
+            return [s for s in (v.strip() for v in values.split(",")) if s]
         if isinstance(values, list):
+            # Stored tags/lists are already list[str]; skip the str() call
+            # for those and only coerce the odd non-string entry.
             out: List[str] = []
             for v in values:
-                if v is None:
+                if isinstance(v, str):
+                    s = v.strip()
+                elif v is None:
                     continue
-                s = str(v).strip()
+                else:
+                    s = str(v).strip()
                 if s:
                     out.append(s)
             return out
-        return [str(values).strip()] if str(values).strip() else []
+        s = str(values).strip()
+        return [s] if s else []
 
     def get(self, *, county: str, parcel_id: str) -> Optional[UserMeta]:
-        row = self.conn.execute(
-            "SELECT county, parcel_id, starred, tags_json, notes, lists_json, updated_at FROM user_meta WHERE county=? AND parcel_id=?",
-            (county, parcel_id),
-        ).fetchone()
+        row = self.conn.execute(_GET_SQL, (county, parcel_id)).fetchone()
         if not row:
             return None
-        try:
-            tags = json.loads(row["tags_json"]) if row["tags_json"] else []
-        except Exception:
-            tags = []
-        try:
-            lists_v = json.loads(row["lists_json"]) if row["lists_json"] else []
-        except Exception:
-            lists_v = []
-
         return UserMeta(
             county=str(row["county"]),
             parcel_id=str(row["parcel_id"]),
             starred=bool(int(row["starred"])),
-            tags=self._clean_list(tags),
+            tags=self._clean_list(_decode_list(row["tags_json"])),
             notes=str(row["notes"] or ""),
-            lists=self._clean_list(lists_v),
+            lists=self._clean_list(_decode_list(row["lists_json"])),
             updated_at=float(row["updated_at"]),
         )
 
-    def upsert(
+    def _build(
         self,
         *,
         county: str,
@@ -118,41 +148,73 @@ class UserMetaSQLite:
         tags: Any,
         notes: str,
         lists: Any,
-    ) -> UserMeta:
-        now = time.time()
-        tags_list = self._clean_list(tags)
-        lists_list = self._clean_list(lists)
-        self.conn.execute(
-            """
-            INSERT INTO user_meta (county, parcel_id, starred, tags_json, notes, lists_json, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(county, parcel_id) DO UPDATE SET
-                starred=excluded.starred,
-                tags_json=excluded.tags_json,
-                notes=excluded.notes,
-                lists_json=excluded.lists_json,
-                updated_at=excluded.updated_at
-            """,
-            (
-                county,
-                parcel_id,
-                1 if starred else 0,
-                json.dumps(tags_list, sort_keys=True),
-                notes or "",
-                json.dumps(lists_list, sort_keys=True),
-                float(now),
-            ),
-        )
-        self.conn.commit()
-        return UserMeta(
+        now: float,
+    ) -> Tuple[UserMeta, Tuple[Any, ...]]:
+        meta = UserMeta(
             county=county,
             parcel_id=parcel_id,
             starred=bool(starred),
-            tags=tags_list,
+            tags=self._clean_list(tags),
             notes=notes or "",
-            lists=lists_list,
+            lists=self._clean_list(lists),
             updated_at=float(now),
         )
+        params = (
+            meta.county,
+            meta.parcel_id,
+            1 if meta.starred else 0,
+            _encode_list(meta.tags),
+            meta.notes,
+            _encode_list(meta.lists),
+            meta.updated_at,
+        )
+        return meta, params
+
+    def upsert(
+        self,
+        *,
+        county: str,
+        parcel_id: str,
+        starred: bool,
+        tags: Any,
+        notes: str,
+        lists: Any,
+    ) -> UserMeta:
+        meta, params = self._build(
+            county=county,
+            parcel_id=parcel_id,
+            starred=starred,
+            tags=tags,
+            notes=notes,
+            lists=lists,
+            now=time.time(),
+        )
+        self.conn.execute(_UPSERT_SQL, params)
+        if not self._in_transaction:
+            self.conn.commit()
+        return meta
+
+    def upsert_many(self, rows: Iterable[Dict[str, Any]]) -> List[UserMeta]:
+        """Upsert ``rows`` (dicts with :meth:`upsert`'s keywords) in one commit."""
+
+        now = time.time()
+        built = [
+            self._build(
+                county=row["county"],
+                parcel_id=row["parcel_id"],
+                starred=row.get("starred", False),
+                tags=row.get("tags"),
+                notes=row.get("notes", ""),
+                lists=row.get("lists"),
+                now=now,
+            )
+            for row in rows
+        ]
+        if not built:
+            return []
+        with self.transaction():
+            self.conn.executemany(_UPSERT_SQL, [params for _, params in built])
+        return [meta for meta, _ in built]
 
 
 def empty_user_meta(*, county: str, parcel_id: str) -> Dict[str, Any]:
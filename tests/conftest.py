@@ -1,8 +1,10 @@
 import os
+import shutil
 import socket
 import sys
 import urllib.request
 from pathlib import Path
+from urllib.request import pathname2url
 
 import pytest
 
@@ -17,9 +19,12 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
-@pytest.fixture(autouse=True)
-def block_network(monkeypatch):
+# Installed once for the whole session rather than re-patched around every
+# test; per-test monkeypatches of these names still restore to the guard.
+@pytest.fixture(autouse=True, scope="session")
+def block_network():
     if os.getenv("LIVE") == "1":
+        yield
         return
 
     real_connect = socket.socket.connect
@@ -30,11 +35,75 @@ def block_network(monkeypatch):
             raise RuntimeError("Network access blocked in tests")
         return real_connect(sock, address)
 
-    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda *args, **kwargs: (_ for _ in ()).throw(
-            RuntimeError("Network access blocked in tests")
-        ),
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket.socket, "connect", guarded_connect)
+        mp.setattr(
+            urllib.request,
+            "urlopen",
+            lambda *args, **kwargs: (_ for _ in ()).throw(
+                RuntimeError("Network access blocked in tests")
+            ),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def _repo_template(tmp_path_factory):
+    base = tmp_path_factory.mktemp("repo_template")
+    pkg = base / "src" / "florida_property_scraper"
+    (pkg / "routers").mkdir(parents=True)
+    (pkg / "backend" / "spiders").mkdir(parents=True)
+    (base / "tests" / "fixtures").mkdir(parents=True)
+    (pkg / "backend" / "spiders" / "__init__.py").write_text(
+        "SPIDERS = {}\n", encoding="utf-8"
     )
+    return base
+
+
+@pytest.fixture
+def repo_skeleton(_repo_template, tmp_path):
+    """Minimal repo tree for the add_county/add_state scaffolding scripts.
+
+    Built once per session and copied per test; callers write their own
+    router seed files into ``src/florida_property_scraper/routers``.
+    """
+    base = tmp_path / "repo"
+    shutil.copytree(_repo_template, base)
+    return base
+
+
+def _fixture_response(name):
+    from scrapy.http import TextResponse
+
+    sample = REPO_ROOT / "tests" / "fixtures" / name
+    file_url = "file://" + pathname2url(str(sample))
+    return TextResponse(url=file_url, body=sample.read_bytes())
+
+
+# Spiders only read from the response, so one parsed fixture per session is
+# shared by every test that needs it.
+@pytest.fixture(scope="session")
+def broward_response():
+    return _fixture_response("broward_sample.html")
+
+
+@pytest.fixture(scope="session")
+def alachua_response():
+    return _fixture_response("alachua_sample.html")
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """One TestClient for the whole session.
+
+    The app reads its env (PA_DB, PARCEL_GEOJSON_DIR, flags) per request, so
+    tests keep isolating state with monkeypatch + tmp_path as before.
+    """
+    from florida_property_scraper.api.app import app
+
+    if app is None:
+        pytest.skip("fastapi not installed")
+
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
@@ -1,10 +1,9 @@
 from scripts import add_state
 
 
-def test_add_state_idempotent(tmp_path):
-    base = tmp_path / "repo"
+def test_add_state_idempotent(repo_skeleton):
+    base = repo_skeleton
     routers_dir = base / "src" / "florida_property_scraper" / "routers"
-    routers_dir.mkdir(parents=True, exist_ok=True)
     (routers_dir / "registry.py").write_text(
         'from florida_property_scraper.routers import fl\n\n_ROUTERS = {\n    "fl": fl,\n}\n\n',
         encoding="utf-8",
@@ -1,12 +1,7 @@
 import os
 
-from florida_property_scraper.api.app import app
-
-
-def test_api_parcels_zoom_gating(tmp_path, monkeypatch):
-    if app is None:
-        return
 
+def test_api_parcels_zoom_gating(api_client, tmp_path, monkeypatch):
     # Point parcel geojson dir to fixtures.
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
@@ -36,13 +31,9 @@ def test_api_parcels_zoom_gating(tmp_path, monkeypatch):
     finally:
         store.close()
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-
     bbox = "-81.38,28.64,-81.36,28.66"
 
-    r = client.get(
+    r = api_client.get(
         "/api/parcels", params={"county": "seminole", "bbox": bbox, "zoom": 14}
     )
     assert r.status_code == 200
@@ -52,7 +43,7 @@ def test_api_parcels_zoom_gating(tmp_path, monkeypatch):
 
     # Use a bbox that intersects the seminole fixtures.
     bbox = "-81.38,28.64,-81.36,28.66"
-    r = client.get(
+    r = api_client.get(
         "/api/parcels", params={"county": "seminole", "bbox": bbox, "zoom": 15}
     )
     assert r.status_code == 200
@@ -88,10 +79,7 @@ def test_api_parcels_zoom_gating(tmp_path, monkeypatch):
             assert props["mortgage_amount"] is None
 
 
-def test_api_parcels_county_switch_and_default(tmp_path, monkeypatch):
-    if app is None:
-        return
-
+def test_api_parcels_county_switch_and_default(api_client, tmp_path, monkeypatch):
     # Point parcel geojson dir to fixtures.
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
@@ -101,13 +89,9 @@ def test_api_parcels_county_switch_and_default(tmp_path, monkeypatch):
     db_path = tmp_path / "leads.sqlite"
     monkeypatch.setenv("PA_DB", str(db_path))
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-
     # Default county is seminole when omitted.
     seminole_bbox = "-81.38,28.64,-81.36,28.66"
-    r = client.get("/api/parcels", params={"bbox": seminole_bbox, "zoom": 15})
+    r = api_client.get("/api/parcels", params={"bbox": seminole_bbox, "zoom": 15})
     assert r.status_code == 200
     data = r.json()
     assert data["type"] == "FeatureCollection"
@@ -116,7 +100,7 @@ def test_api_parcels_county_switch_and_default(tmp_path, monkeypatch):
 
     # Switching county to orange returns orange features in orange bbox.
     orange_bbox = "-81.312,28.535,-81.301,28.543"
-    r = client.get(
+    r = api_client.get(
         "/api/parcels", params={"county": "orange", "bbox": orange_bbox, "zoom": 15}
     )
     assert r.status_code == 200
@@ -126,12 +110,7 @@ def test_api_parcels_county_switch_and_default(tmp_path, monkeypatch):
     assert str(data["features"][0].get("id", "")).startswith("orange:")
 
 
-def test_api_parcel_hover_contract(tmp_path, monkeypatch):
-    if app is None:
-        return
-
-    from fastapi.testclient import TestClient
-
+def test_api_parcel_hover_contract(api_client, tmp_path, monkeypatch):
     # Build a PA DB with a single record.
     db_path = tmp_path / "leads.sqlite"
     monkeypatch.setenv("PA_DB", str(db_path))
@@ -156,8 +135,7 @@ def test_api_parcel_hover_contract(tmp_path, monkeypatch):
     finally:
         store.close()
 
-    client = TestClient(app)
-    r = client.get("/api/parcels/seminole/SEM-0001/hover")
+    r = api_client.get("/api/parcels/seminole/SEM-0001/hover")
     assert r.status_code == 200
     data = r.json()
 
@@ -184,12 +162,7 @@ def test_api_parcel_hover_contract(tmp_path, monkeypatch):
     assert data["mortgage_lender"] == ""
 
 
-def test_api_parcel_detail_includes_pa_and_user_meta(tmp_path, monkeypatch):
-    if app is None:
-        return
-
-    from fastapi.testclient import TestClient
-
+def test_api_parcel_detail_includes_pa_and_user_meta(api_client, tmp_path, monkeypatch):
     # Isolate PA DB and user-meta DB.
     db_path = tmp_path / "leads.sqlite"
     user_db = tmp_path / "user_meta.sqlite"
@@ -216,8 +189,7 @@ def test_api_parcel_detail_includes_pa_and_user_meta(tmp_path, monkeypatch):
     finally:
         store.close()
 
-    client = TestClient(app)
-    r = client.get("/api/parcels/SEM-0001", params={"county": "seminole"})
+    r = api_client.get("/api/parcels/SEM-0001", params={"county": "seminole"})
     assert r.status_code == 200
     data = r.json()
 
@@ -233,10 +205,7 @@ def test_api_parcel_detail_includes_pa_and_user_meta(tmp_path, monkeypatch):
     assert data["user_meta"]["starred"] is False
 
 
-def test_api_parcels_search_polygon_and_radius(tmp_path, monkeypatch):
-    if app is None:
-        return
-
+def test_api_parcels_search_polygon_and_radius(api_client, tmp_path, monkeypatch):
     # Point parcel geojson dir to fixtures.
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
@@ -266,11 +235,8 @@ def test_api_parcels_search_polygon_and_radius(tmp_path, monkeypatch):
     finally:
         store.close()
 
-    from fastapi.testclient import TestClient
     from florida_property_scraper.parcels.geometry_search import circle_polygon
 
-    client = TestClient(app)
-
     # Polygon tightly around SEM-0001 fixture.
     poly = {
         "type": "Polygon",
@@ -285,7 +251,7 @@ def test_api_parcels_search_polygon_and_radius(tmp_path, monkeypatch):
         ],
     }
 
-    r = client.post(
+    r = api_client.post(
         "/api/parcels/search",
         json={"county": "seminole", "geometry": poly, "limit": 50},
     )
@@ -297,14 +263,14 @@ def test_api_parcels_search_polygon_and_radius(tmp_path, monkeypatch):
 
     # Radius search should match an equivalent circle polygon.
     circle = circle_polygon(center_lon=-81.369, center_lat=28.651, miles=0.25)
-    r_circle = client.post(
+    r_circle = api_client.post(
         "/api/parcels/search",
         json={"county": "seminole", "geometry": circle, "limit": 50},
     )
     assert r_circle.status_code == 200
     poly_rows = {row["parcel_id"] for row in r_circle.json()["results"]}
 
-    r_radius = client.post(
+    r_radius = api_client.post(
         "/api/parcels/search",
         json={
             "county": "seminole",
@@ -318,10 +284,9 @@ def test_api_parcels_search_polygon_and_radius(tmp_path, monkeypatch):
     assert radius_rows == poly_rows
 
 
-def test_api_parcels_search_trigger_unknown_field_never_matches(tmp_path, monkeypatch):
-    if app is None:
-        return
-
+def test_api_parcels_search_trigger_unknown_field_never_matches(
+    api_client, tmp_path, monkeypatch
+):
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
     monkeypatch.setenv("PARCEL_GEOJSON_DIR", fixtures_dir)
@@ -329,10 +294,6 @@ def test_api_parcels_search_trigger_unknown_field_never_matches(tmp_path, monkey
     db_path = tmp_path / "leads.sqlite"
     monkeypatch.setenv("PA_DB", str(db_path))
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-
     # Geometry that intersects SEM-0001.
     poly = {
         "type": "Polygon",
@@ -358,32 +319,25 @@ def test_api_parcels_search_trigger_unknown_field_never_matches(tmp_path, monkey
             }
         ],
     }
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 200
     data = r.json()
     assert data["count"] == 0
 
 
-def test_api_parcel_meta_roundtrip(tmp_path, monkeypatch):
-    if app is None:
-        return
-
-    from fastapi.testclient import TestClient
-
+def test_api_parcel_meta_roundtrip(api_client, tmp_path, monkeypatch):
     db_path = tmp_path / "leads.sqlite"
     user_db = tmp_path / "user_meta.sqlite"
     monkeypatch.setenv("PA_DB", str(db_path))
     monkeypatch.setenv("USER_META_DB", str(user_db))
 
-    client = TestClient(app)
-
     payload = {
         "starred": True,
         "tags": ["warm"],
         "notes": "call next week",
         "lists": ["followup"],
     }
-    r = client.put(
+    r = api_client.put(
         "/api/parcels/SEM-0001/meta", params={"county": "seminole"}, json=payload
     )
     assert r.status_code == 200
@@ -395,7 +349,7 @@ def test_api_parcel_meta_roundtrip(tmp_path, monkeypatch):
     assert saved["notes"] == "call next week"
     assert saved["lists"] == ["followup"]
 
-    r = client.get("/api/parcels/SEM-0001/meta", params={"county": "seminole"})
+    r = api_client.get("/api/parcels/SEM-0001/meta", params={"county": "seminole"})
     assert r.status_code == 200
     loaded = r.json()
     assert loaded["starred"] is True
@@ -68,12 +68,7 @@ def test_flag_strict_schema_validation_toggles_native_engine(monkeypatch):
         )
 
 
-def test_flag_geometry_search_disables_endpoint(monkeypatch, tmp_path):
-    from florida_property_scraper.api.app import app
-
-    if app is None:
-        pytest.skip("fastapi not installed")
-
+def test_flag_geometry_search_disables_endpoint(api_client, monkeypatch, tmp_path):
     _reset_flags(monkeypatch, FPS_FEATURE_GEOMETRY_SEARCH="0")
 
     # Ensure parcel geojson uses fixtures.
@@ -84,9 +79,6 @@ def test_flag_geometry_search_disables_endpoint(monkeypatch, tmp_path):
     # Isolate PA DB.
     monkeypatch.setenv("PA_DB", str(tmp_path / "leads.sqlite"))
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     payload = {
         "county": "seminole",
         "geometry": {
@@ -94,16 +86,11 @@ def test_flag_geometry_search_disables_endpoint(monkeypatch, tmp_path):
             "coordinates": [[[0, 0], [0, 0], [0, 0], [0, 0]]],
         },
     }
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 404
 
 
-def test_flag_triggers_toggles_filtering(monkeypatch, tmp_path):
-    from florida_property_scraper.api.app import app
-
-    if app is None:
-        pytest.skip("fastapi not installed")
-
+def test_flag_triggers_toggles_filtering(api_client, monkeypatch, tmp_path):
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
     monkeypatch.setenv("PARCEL_GEOJSON_DIR", fixtures_dir)
@@ -129,9 +116,6 @@ def test_flag_triggers_toggles_filtering(monkeypatch, tmp_path):
     finally:
         store.close()
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     geometry = {
         "type": "Polygon",
         "coordinates": [
@@ -159,26 +143,21 @@ def test_flag_triggers_toggles_filtering(monkeypatch, tmp_path):
 
     # Triggers enabled: requires a match -> empty.
     _reset_flags(monkeypatch, FPS_FEATURE_TRIGGERS="1")
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 200
     data = r.json()
     assert data["count"] == 0
 
     # Triggers disabled: triggers ignored -> returns results.
     _reset_flags(monkeypatch, FPS_FEATURE_TRIGGERS="0")
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 200
     data = r.json()
     assert data["count"] >= 1
     assert data["results"][0]["reason_codes"] == []
 
 
-def test_flag_sale_filtering_toggles_filter_eval(monkeypatch, tmp_path):
-    from florida_property_scraper.api.app import app
-
-    if app is None:
-        pytest.skip("fastapi not installed")
-
+def test_flag_sale_filtering_toggles_filter_eval(api_client, monkeypatch, tmp_path):
     repo_root = os.path.dirname(os.path.dirname(__file__))
     fixtures_dir = os.path.join(repo_root, "tests", "fixtures", "parcels")
     monkeypatch.setenv("PARCEL_GEOJSON_DIR", fixtures_dir)
@@ -204,9 +183,6 @@ def test_flag_sale_filtering_toggles_filter_eval(monkeypatch, tmp_path):
     finally:
         store.close()
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     geometry = {
         "type": "Polygon",
         "coordinates": [
@@ -227,13 +203,13 @@ def test_flag_sale_filtering_toggles_filter_eval(monkeypatch, tmp_path):
     }
 
     _reset_flags(monkeypatch, FPS_FEATURE_SALE_FILTERING="1")
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 200
     data = r.json()
     assert data["count"] >= 1
 
     _reset_flags(monkeypatch, FPS_FEATURE_SALE_FILTERING="0")
-    r = client.post("/api/parcels/search", json=payload)
+    r = api_client.post("/api/parcels/search", json=payload)
     assert r.status_code == 200
     data = r.json()
     assert data["count"] == 0
@@ -1,5 +1,6 @@
 import os
 
+import pytest
 
 from florida_property_scraper.parcels.geometry_registry import get_provider
 
@@ -42,3 +43,88 @@ def test_spatial_index_filters_to_bbox_orange(monkeypatch):
     features = provider.query((-81.312, 28.535, -81.301, 28.543))
     parcel_ids = {f.parcel_id for f in features}
     assert {"ORA-0001", "ORA-0002"}.issubset(parcel_ids)
+
+
+def test_shape_bounds_matches_scalar_bounds():
+    from shapely.geometry import Point, Polygon
+
+    from florida_property_scraper.parcels.geometry_provider import shape_bounds
+
+    square = Polygon([(0, 0), (2, 0), (2, 1), (0, 1)])
+    bounds = shape_bounds([square, None, Polygon(), Point(5, 6)])
+    assert bounds == [square.bounds, None, None, (5.0, 6.0, 5.0, 6.0)]
+
+
+@pytest.mark.parametrize("with_ijson", [True, False])
+def test_iter_geojson_features_reads_geojsonseq(tmp_path, monkeypatch, with_ijson):
+    import json
+    import sys
+
+    from florida_property_scraper.parcels.geometry_provider import (
+        iter_geojson_features,
+    )
+
+    feats = [
+        {"type": "Feature", "properties": {"parcel_id": f"P{i}"}, "geometry": None}
+        for i in range(3)
+    ]
+    collection = tmp_path / "fc.geojson"
+    collection.write_text(json.dumps({"type": "FeatureCollection", "features": feats}))
+    seq = tmp_path / "seq.geojson"
+    seq.write_bytes(b"".join(b"\x1e" + json.dumps(f).encode() + b"\n" for f in feats))
+    ndjson = tmp_path / "features.geojsonl"
+    ndjson.write_text("".join(json.dumps(f) + "\n" for f in feats))
+    pretty = tmp_path / "pretty.geojson"
+    pretty.write_text(json.dumps({"features": feats}, indent=2))
+    if not with_ijson:
+        monkeypatch.setitem(sys.modules, "ijson", None)
+
+    assert list(iter_geojson_features(collection)) == feats
+    assert list(iter_geojson_features(seq)) == feats
+    assert list(iter_geojson_features(ndjson)) == feats
+    assert list(iter_geojson_features(pretty)) == feats
+
+
+def test_iter_geojson_features_streams_collection_with_ijson(tmp_path, monkeypatch):
+    import json
+
+    ijson = pytest.importorskip("ijson")
+    from florida_property_scraper.parcels.geometry_provider import (
+        iter_geojson_features,
+    )
+
+    feats = [
+        {
+            "type": "Feature",
+            "properties": {"parcel_id": f"P{i}"},
+            "geometry": {"type": "Point", "coordinates": [-81.5 + i, 28.25]},
+        }
+        for i in range(3)
+    ]
+    collection = tmp_path / "fc.geojson"
+    collection.write_text(json.dumps({"type": "FeatureCollection", "features": feats}))
+    # Minified, with "type" last and well past the first 4 KiB.
+    features_first = tmp_path / "features_first.geojson"
+    features_first.write_text(
+        json.dumps({"features": feats * 100, "type": "FeatureCollection"})
+    )
+
+    calls = []
+    real_items = ijson.items
+    real_loads = json.loads
+
+    def spy_items(*args, **kwargs):
+        calls.append(args[1])
+        return real_items(*args, **kwargs)
+
+    def spy_loads(*args, **kwargs):
+        calls.append("json.loads")
+        return real_loads(*args, **kwargs)
+
+    monkeypatch.setattr(ijson, "items", spy_items)
+    monkeypatch.setattr(json, "loads", spy_loads)
+
+    assert list(iter_geojson_features(collection)) == feats
+    assert list(iter_geojson_features(features_first)) == feats * 100
+    # Both collections stream through ijson without a json.loads pass.
+    assert calls == ["features.item", "features.item"]
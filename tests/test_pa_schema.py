@@ -0,0 +1,17 @@
+from dataclasses import asdict
+
+from florida_property_scraper.pa.schema import PAProperty
+
+
+def test_to_dict_matches_asdict_and_copies_lists():
+    rec = PAProperty(
+        county="seminole",
+        parcel_id="SEM-0001",
+        owner_names=["A", "B"],
+        exemptions=["HX"],
+        latitude=28.65,
+    )
+    out = rec.to_dict()
+    assert out == asdict(rec)
+    assert list(out) == list(asdict(rec))
+    assert out["owner_names"] is not rec.owner_names
@@ -1,5 +1,8 @@
+import sqlite3
 import tempfile
 
+import pytest
+
 from florida_property_scraper.signals import generate_events
 from florida_property_scraper.storage import SQLiteStore
 
@@ -41,3 +44,69 @@ def test_storage_events_flow():
         types = {row["event_type"] for row in rows}
         assert "OWNER_CHANGED" in types
         assert "SALE_DETECTED" in types
+
+
+def test_storage_pipeline_commits_each_item(tmp_path, monkeypatch):
+    from florida_property_scraper.scrapy_project.pipelines import StoragePipeline
+
+    db_path = tmp_path / "leads.sqlite"
+    pipeline = StoragePipeline(SQLiteStore(str(db_path)), "run1")
+    other = sqlite3.connect(db_path, timeout=0)
+
+    def committed():
+        return other.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+
+    for i in range(2):
+        pipeline.process_item(
+            {"county": "Orange", "parcel_id": str(i), "owner_name": f"Owner {i}"}
+        )
+        assert committed() == i + 1
+        # No write lock is held between items.
+        other.execute("CREATE TABLE IF NOT EXISTS scratch (x INTEGER)")
+        other.execute("INSERT INTO scratch VALUES (?)", (i,))
+        other.commit()
+
+    # A failing item rolls back its own writes only.
+    def boom(events):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(pipeline.store, "insert_events", boom)
+    with pytest.raises(RuntimeError):
+        pipeline.process_item({"county": "Orange", "parcel_id": "bad"})
+
+    pipeline.close_spider(None)
+    parcels = {row[0] for row in other.execute("SELECT parcel_id FROM observations")}
+    other.close()
+    assert parcels == {"0", "1"}
+
+
+def test_storage_transaction_commits_once_and_rolls_back(tmp_path):
+    store = SQLiteStore(str(tmp_path / "leads.sqlite"))
+    obs = {
+        "property_uid": "Orange:1",
+        "county": "Orange",
+        "parcel_id": "1",
+        "situs_address": "123 Main St",
+        "owner_name": "Alice Smith",
+        "mailing_address": "123 Main St",
+        "last_sale_date": None,
+        "last_sale_price": None,
+        "deed_type": None,
+        "source_url": "http://example.com",
+        "raw_json": "{}",
+        "observed_at": "2024-01-01T00:00:00Z",
+        "run_id": "run1",
+    }
+    with store.transaction():
+        store.insert_observation(obs)
+        assert store.conn.in_transaction
+    assert not store.conn.in_transaction
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.insert_observation({**obs, "observed_at": "2024-02-01T00:00:00Z"})
+            raise RuntimeError("boom")
+
+    latest = store.get_latest_observation("Orange:1")
+    store.close()
+    assert latest["observed_at"] == "2024-01-01T00:00:00Z"
@@ -0,0 +1,26 @@
+import json
+
+from florida_property_scraper.leads import normalize_record
+from florida_property_scraper.storage import SQLiteStore
+
+
+def test_upsert_lead_raw_json_matches_record(tmp_path):
+    store = SQLiteStore(str(tmp_path / "leads.sqlite"))
+    record = normalize_record(
+        {
+            "county": "Orange",
+            "parcel_id": "123",
+            "owner_name": "Jane Smith",
+            "contact_phones": ["555-0100"],
+            "purchase_history": [{"sale_date": "2020-01-01", "sale_price": 1}],
+        }
+    )
+    store.upsert_lead(record)
+    row = store.conn.execute(
+        "SELECT contact_phones, purchase_history, raw_json FROM leads"
+    ).fetchone()
+    store.close()
+
+    assert row["raw_json"] == json.dumps(record, ensure_ascii=True)
+    assert json.loads(row["contact_phones"]) == ["555-0100"]
+    assert json.loads(row["purchase_history"]) == record["purchase_history"]
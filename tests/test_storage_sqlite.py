@@ -1,5 +1,7 @@
 import sqlite3
 
+import pytest
+
 from florida_property_scraper.storage import SQLiteStorage
 
 
@@ -57,3 +59,117 @@ def test_sqlite_storage_dedupes(tmp_path):
 
     assert owners_count == 1
     assert properties_count == 2
+
+
+def test_sqlite_storage_assigns_owner_ids_in_item_order(tmp_path):
+    db_path = tmp_path / "leads.sqlite"
+    storage = SQLiteStorage(str(db_path))
+    owners = ["Dave", "Bob", "Carol", "Bob", "Alice"]
+    storage.save_items(
+        {"county": "broward", "owner": owner, "address": f"{i} Main St"}
+        for i, owner in enumerate(owners)
+    )
+    storage.close()
+
+    conn = sqlite3.connect(str(db_path))
+    rows = conn.execute("SELECT name FROM owners ORDER BY id").fetchall()
+    conn.close()
+
+    assert [row[0] for row in rows] == ["Dave", "Bob", "Carol", "Alice"]
+
+
+def test_schema_versions_share_one_file(tmp_path):
+    from florida_property_scraper.storage import SQLiteStore
+
+    db_path = str(tmp_path / "leads.sqlite")
+    SQLiteStorage(db_path).close()
+    SQLiteStore(db_path).close()
+    # Re-opening skips the migrations but both schemas stay usable.
+    SQLiteStorage(db_path).close()
+    store = SQLiteStore(db_path)
+    tables = {
+        row[0]
+        for row in store.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )
+    }
+    version = store.conn.execute("PRAGMA user_version").fetchone()[0]
+    store.close()
+
+    assert {"owners", "properties", "leads", "runs", "observations", "events"} <= tables
+    assert version == 0b11
+
+
+def test_pa_store_uses_wal_and_skips_repeat_migrations(tmp_path):
+    from florida_property_scraper.pa.storage import PASQLite
+
+    db_path = str(tmp_path / "leads.sqlite")
+    PASQLite(db_path).close()
+    store = PASQLite(db_path)
+    mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    version = store.conn.execute("PRAGMA user_version").fetchone()[0]
+    store.close()
+
+    assert mode == "wal"
+    assert version == 0b100
+
+
+def test_pa_upsert_many_writes_batch_and_updates(tmp_path):
+    from florida_property_scraper.pa.schema import PAProperty
+    from florida_property_scraper.pa.storage import PASQLite
+
+    store = PASQLite(str(tmp_path / "pa.sqlite"))
+    store.upsert_many(
+        PAProperty(county="seminole", parcel_id=f"P{i}", year_built=1990 + i)
+        for i in range(3)
+    )
+    store.upsert_many([PAProperty(county="seminole", parcel_id="P1", year_built=2020)])
+    got = store.get_many(county="seminole", parcel_ids=["P0", "P1", "P2"])
+    store.close()
+
+    assert sorted(got) == ["P0", "P1", "P2"]
+    assert got["P1"].year_built == 2020
+
+
+def test_store_pragmas_keep_page_size_with_wal(tmp_path):
+    from florida_property_scraper.storage import SQLiteStore
+
+    store = SQLiteStore(str(tmp_path / "leads.sqlite"))
+    page_size = store.conn.execute("PRAGMA page_size").fetchone()[0]
+    mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    store.close()
+
+    assert page_size == 8192
+    assert mode == "wal"
+
+
+def test_user_meta_upsert_many_and_transaction(tmp_path):
+    from florida_property_scraper.user_meta.storage import UserMetaSQLite
+
+    store = UserMetaSQLite(str(tmp_path / "user.sqlite"))
+    metas = store.upsert_many(
+        [
+            {"county": "orange", "parcel_id": "A", "starred": True, "tags": "x, y"},
+            {"county": "orange", "parcel_id": "B", "lists": ["hot", " "]},
+        ]
+    )
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.upsert(
+                county="orange",
+                parcel_id="C",
+                starred=False,
+                tags=[],
+                notes="",
+                lists=[],
+            )
+            raise RuntimeError("boom")
+    got_a = store.get(county="orange", parcel_id="A")
+    got_b = store.get(county="orange", parcel_id="B")
+    got_c = store.get(county="orange", parcel_id="C")
+    store.close()
+
+    assert [m.parcel_id for m in metas] == ["A", "B"]
+    assert got_a.starred and got_a.tags == ["x", "y"]
+    assert got_b.lists == ["hot"]
+    assert got_c is None